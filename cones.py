@@ -1,4 +1,5 @@
-import math
+from math import atan, cos, degrees, hypot, radians, sin, sqrt, tan
+from typing import Iterable
 
 
 def distance(
@@ -13,31 +14,93 @@ def distance(
 
     example:
         >>> distance(60, 15, 20, 7, 127, 30)
-        46.503239630149544
+        46.503239630149515
+        >>> distance(250, 0, 10, 90, 100, 30)
+        258.8897063375562
     """
-    # Convert all angles to radians
-    cone_half_angle = math.radians(cone_half_angle)
-    angle_point_1 = math.radians(angle_point_1)
-    angle_point_2 = math.radians(angle_point_2)
+    # Convert the half-angle to radians
+    cone_half_angle = radians(cone_half_angle)
+    sin_half_angle = sin(cone_half_angle)
+
+    # Calculate the height of the cone and how far each unit of height
+    # below the apex sits from the apex once the cone is laid flat
+    apex_height = cone_large_end_diameter / (2 * tan(cone_half_angle))
+    side_per_height = cone_large_end_diameter / apex_height / (2 * sin_half_angle)
+
+    return _distance_on_cone(
+        height_point_1,
+        angle_point_1,
+        height_point_2,
+        angle_point_2,
+        apex_height,
+        side_per_height,
+        sin_half_angle,
+    )
+
 
-    # Calculate the height of the cone
-    apex_height = cone_large_end_diameter / (2 * math.tan(cone_half_angle))
+def distances(
+    points: Iterable[tuple[float, float, float, float]],
+    cone_large_end_diameter: float,
+    cone_half_angle: float,
+) -> list[float]:
+    """Find the shortest paths between many pairs of points on the same cone
 
-    # Calculate the cone diameter at each point
-    diameter1 = (apex_height - height_point_1) * cone_large_end_diameter / apex_height
-    diameter2 = (apex_height - height_point_2) * cone_large_end_diameter / apex_height
+    Each pair is (height_point_1, angle_point_1, height_point_2, angle_point_2).
+    The cone geometry is only evaluated once for the whole batch.
 
+    example:
+        >>> distances([(60, 15, 20, 7), (20, 7, 60, 15)], 127, 30)
+        [46.503239630149515, 46.503239630149515]
+    """
+    # Everything that depends only on the cone is computed once
+    cone_half_angle = radians(cone_half_angle)
+    sin_half_angle = sin(cone_half_angle)
+
+    # Calculate the height of the cone and how far each unit of height
+    # below the apex sits from the apex once the cone is laid flat
+    apex_height = cone_large_end_diameter / (2 * tan(cone_half_angle))
+    side_per_height = cone_large_end_diameter / apex_height / (2 * sin_half_angle)
+
+    return [
+        _distance_on_cone(
+            height_point_1,
+            angle_point_1,
+            height_point_2,
+            angle_point_2,
+            apex_height,
+            side_per_height,
+            sin_half_angle,
+        )
+        for height_point_1, angle_point_1, height_point_2, angle_point_2 in points
+    ]
+
+
+def _distance_on_cone(
+    height_point_1: float,
+    angle_point_1: float,
+    height_point_2: float,
+    angle_point_2: float,
+    apex_height: float,
+    side_per_height: float,
+    sin_half_angle: float,
+) -> float:
     # Calculate the side length at each point.
     # This is the radius of the point location in the flat
-    side1 = diameter1 / (2 * math.sin(cone_half_angle))
-    side2 = diameter2 / (2 * math.sin(cone_half_angle))
+    side1 = (apex_height - height_point_1) * side_per_height
+    side2 = (apex_height - height_point_2) * side_per_height
 
     # Calculate the included angle between points in the flat
     # sine(cone_half_angle) gives the percent of a circle the cone covers in the flat
-    angle = math.sin(cone_half_angle) * abs(angle_point_1 - angle_point_2)
+    angle = sin_half_angle * abs(radians(angle_point_1 - angle_point_2))
 
-    # Return side "c" from side-angle-side triangle formula
-    return math.sqrt(side1**2 + side2**2 - (2 * side1 * side2 * math.cos(angle)))
+    # Return side "c" from side-angle-side triangle formula, written as
+    # (a - b)^2 + 4ab*sin^2(C/2) so small included angles don't cancel out.
+    # A point past the apex gives sides of opposite sign, where the
+    # product can't be square rooted, so use the plain law of cosines.
+    side_product = side1 * side2
+    if side_product < 0:
+        return sqrt(side1 * side1 + side2 * side2 - (2 * side_product * cos(angle)))
+    return hypot(side1 - side2, 2 * sqrt(side_product) * sin(angle / 2))
 
 
 def angle(dia_lg_end: float, dia_sm_end: float, length: float) -> float:
@@ -48,7 +111,7 @@ def angle(dia_lg_end: float, dia_sm_end: float, length: float) -> float:
         30.000727780827372
     """
     delta = (dia_lg_end - dia_sm_end) / 2
-    return math.degrees(math.atan(delta / length))
+    return degrees(atan(delta / length))
 
 
 def radius_at_location(
@@ -60,9 +123,21 @@ def radius_at_location(
         >>> radius_at_location(174, 60, 58)
         53.51368438700171
     """
-    return dia_lg_end / 2 - (
-        math.tan(math.radians(apex_angle / 2)) * location_from_lg_end
-    )
+    return dia_lg_end / 2 - tan(radians(apex_angle / 2)) * location_from_lg_end
+
+
+def radii_at_locations(
+    dia_lg_end: float, apex_angle: float, locations_from_lg_end: Iterable[float]
+) -> list[float]:
+    """Calculate the radius at many locations on the same cone.
+
+    example:
+        >>> radii_at_locations(174, 60, [0, 58])
+        [87.0, 53.51368438700171]
+    """
+    radius_lg_end = dia_lg_end / 2
+    slope = tan(radians(apex_angle / 2))
+    return [radius_lg_end - slope * location for location in locations_from_lg_end]
 
 
 def height(dia_lg_end: float, dia_sm_end: float, apex_angle: float) -> float:
@@ -72,9 +147,25 @@ def height(dia_lg_end: float, dia_sm_end: float, apex_angle: float) -> float:
         >>> height(228, 38, 60)
         164.54482671904336
     """
-    half_angle = math.radians(apex_angle / 2)
+    half_angle = radians(apex_angle / 2)
     annular_distance = abs((dia_lg_end - dia_sm_end) / 2)
-    return annular_distance / math.tan(half_angle)
+    return annular_distance / tan(half_angle)
+
+
+def heights(diameters: Iterable[tuple[float, float]], apex_angle: float) -> list[float]:
+    """Calculate the heights of many frustums sharing the same apex angle.
+
+    Each frustum is given as (dia_lg_end, dia_sm_end).
+
+    example:
+        >>> heights([(228, 38), (38, 228)], 60)
+        [164.54482671904336, 164.54482671904336]
+    """
+    tan_half_angle = tan(radians(apex_angle / 2))
+    return [
+        abs((dia_lg_end - dia_sm_end) / 2) / tan_half_angle
+        for dia_lg_end, dia_sm_end in diameters
+    ]
 
 
 if __name__ == "__main__":
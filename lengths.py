@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import fractions
 import re
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import lru_cache
+
+_LENGTH_PATTERN = re.compile(r"""(?P<feet>.*(?:'|ft))?-?(?P<inches>.*(?:"|in))""")
 
 
-@total_ordering
 @dataclass(slots=True)
 class USCustomary:
     """Class to store a length in US Customary units
@@ -18,6 +18,9 @@ class USCustomary:
         USCustomary(feet=1, inch=3)
         >>> USCustomary(4.5)
         USCustomary(feet=4.0, inch=6.0)
+
+    For large sorts, use sorted(lengths, key=attrgetter("inches_total"))
+    to compare plain numbers instead of going through the comparison methods.
     """
 
     feet: int = 0
@@ -51,9 +54,12 @@ class USCustomary:
             >>> USCustomary.from_str('12.375in')
             USCustomary(feet=1.0, inch=0.375)
         """
-        match_sym = re.search(r"""(?P<feet>.*')?-?(?P<inches>.*")""", val)
-        match_chr = re.search(r"(?P<feet>.*ft)?-?(?P<inches>.*in)", val)
-        match = match_sym or match_chr
+        return cls(*cls._parse(val))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse(val: str) -> tuple[int, float]:
+        match = _LENGTH_PATTERN.search(val)
         if not match:
             raise ValueError(f"Could not form USCustomary from {val}")
         feet = match.group("feet")
@@ -69,9 +75,11 @@ class USCustomary:
         inches, *fraction = inches.split()
         inches = float(inches)
         if fraction:
-            frac = fractions.Fraction(fraction[0])
-            inches += int(frac.numerator) / int(frac.denominator)
-        return cls(feet, inches)
+            numerator, _, denominator = fraction[0].partition("/")
+            inches += (
+                int(numerator) / int(denominator) if denominator else float(numerator)
+            )
+        return feet, inches
 
     @property
     def as_metric(self) -> Metric:
@@ -81,7 +89,7 @@ class USCustomary:
             >>> USCustomary(12, 0).as_metric
             Metric(millimeters=3657.6)
         """
-        return Metric(self.as_inches * 25.4)
+        return Metric(self.inches_total * 25.4)
 
     @property
     def as_feet(self) -> float:
@@ -100,53 +108,51 @@ class USCustomary:
         example:
             >>> USCustomary(12, 3.5).as_inches
             147.5
+            >>> length = USCustomary(1, 3)
+            >>> length.inch = 5
+            >>> length.as_inches
+            17
         """
         return self.feet * 12 + self.inch
 
+    inches_total = as_inches
+
     def __add__(self, other: object) -> USCustomary:
-        if isinstance(other, Metric):
-            other = other.as_us_customary
-        if not isinstance(other, USCustomary):
-            raise NotImplementedError
-        return USCustomary(inch=self.as_inches + other.as_inches)
+        return USCustomary(inch=self.inches_total + _to_inches(other))
 
     def __sub__(self, other: object) -> USCustomary:
-        if isinstance(other, Metric):
-            other = other.as_us_customary
-        if not isinstance(other, USCustomary):
-            raise NotImplementedError
-        return USCustomary(inch=self.as_inches - other.as_inches)
+        return USCustomary(inch=self.inches_total - _to_inches(other))
 
     def __truediv__(self, val: float | USCustomary) -> USCustomary | float:
         if isinstance(val, USCustomary):
-            return self.as_inches / val.as_inches
-        return USCustomary(inch=self.as_inches / val)
+            return self.inches_total / val.inches_total
+        return USCustomary(inch=self.inches_total / val)
 
     __rtruediv__ = __truediv__
 
     def __mul__(self, val: float | USCustomary) -> USCustomary | float:
         if isinstance(val, USCustomary):
-            return self.as_inches * val.as_inches
-        return USCustomary(inch=self.as_inches * val)
+            return self.inches_total * val.inches_total
+        return USCustomary(inch=self.inches_total * val)
 
     __rmul__ = __mul__
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Metric):
-            other = other.as_us_customary
-        if not isinstance(other, USCustomary):
-            raise NotImplementedError
-        return self.as_inches == other.as_inches
+        return self.inches_total == _to_inches(other)
+
+    def __lt__(self, other: object) -> bool:
+        return self.inches_total < _to_inches(other)
+
+    def __le__(self, other: object) -> bool:
+        return self.inches_total <= _to_inches(other)
 
     def __gt__(self, other: object) -> bool:
-        if isinstance(other, Metric):
-            other = other.as_us_customary
-        if not isinstance(other, USCustomary):
-            raise NotImplementedError
-        return self.as_inches > other.as_inches
+        return self.inches_total > _to_inches(other)
+
+    def __ge__(self, other: object) -> bool:
+        return self.inches_total >= _to_inches(other)
 
 
-@total_ordering
 @dataclass(slots=True)
 class Metric:
     """Class to store a length in Metric units
@@ -154,6 +160,8 @@ class Metric:
     examples:
         >>> Metric(3000)
         Metric(millimeters=3000)
+
+    For large sorts, use sorted(lengths, key=attrgetter("millimeters")).
     """
 
     millimeters: float = 0
@@ -169,18 +177,10 @@ class Metric:
         return USCustomary(inch=self.millimeters / 25.4)
 
     def __add__(self, other: object) -> Metric:
-        if isinstance(other, USCustomary):
-            other = other.as_metric
-        if not isinstance(other, Metric):
-            raise NotImplementedError
-        return Metric(self.millimeters + other.millimeters)
+        return Metric(self.millimeters + _to_millimeters(other))
 
     def __sub__(self, other: object) -> Metric:
-        if isinstance(other, USCustomary):
-            other = other.as_metric
-        if not isinstance(other, Metric):
-            raise NotImplementedError
-        return Metric(self.millimeters - other.millimeters)
+        return Metric(self.millimeters - _to_millimeters(other))
 
     def __truediv__(self, val: float | Metric) -> Metric | float:
         if isinstance(val, Metric):
@@ -197,18 +197,35 @@ class Metric:
     __rmul__ = __mul__
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, USCustomary):
-            other = other.as_metric
-        if not isinstance(other, Metric):
-            raise NotImplementedError
-        return self.millimeters == other.millimeters
+        return self.millimeters == _to_millimeters(other)
+
+    def __lt__(self, other: object) -> bool:
+        return self.millimeters < _to_millimeters(other)
+
+    def __le__(self, other: object) -> bool:
+        return self.millimeters <= _to_millimeters(other)
 
     def __gt__(self, other: object) -> bool:
-        if isinstance(other, USCustomary):
-            other = other.as_metric
-        if not isinstance(other, Metric):
-            raise NotImplementedError
-        return self.millimeters > other.millimeters
+        return self.millimeters > _to_millimeters(other)
+
+    def __ge__(self, other: object) -> bool:
+        return self.millimeters >= _to_millimeters(other)
+
+
+def _to_inches(other: object) -> float:
+    if isinstance(other, USCustomary):
+        return other.inches_total
+    if isinstance(other, Metric):
+        return other.millimeters / 25.4
+    raise NotImplementedError
+
+
+def _to_millimeters(other: object) -> float:
+    if isinstance(other, Metric):
+        return other.millimeters
+    if isinstance(other, USCustomary):
+        return other.inches_total * 25.4
+    raise NotImplementedError
 
 
 if __name__ == "__main__":
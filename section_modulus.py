@@ -3,8 +3,14 @@ from math import pi
 from typing import Iterable, Optional
 
 
+class _SectionModuliCache:
+    # Slots for Section's lazily computed moduli, kept out of its dataclass fields.
+    # An unset slot raises AttributeError, which marks a modulus not yet computed.
+    __slots__ = ("_Sx", "_Sy")
+
+
 @dataclass(slots=True, frozen=True)
-class Section:
+class Section(_SectionModuliCache):
     centroid: tuple[Optional[tuple[float, float]], Optional[tuple[float, float]]] = (
         (0, 0),
         (0, 0),
@@ -21,25 +27,45 @@ class Section:
         return self.moment_of_inertia[1]
 
     @property
-    def Sx(self) -> Optional[tuple[float, float]]:
-        if not self.Ixx or not self.centroid[1]:
-            return None
-        return self.Ixx / self.centroid[1][0], self.Ixx / self.centroid[1][1]
+    def Sx(self) -> Optional[tuple[Optional[float], Optional[float]]]:
+        try:
+            return self._Sx
+        except AttributeError:
+            # Frozen, so the first result can be kept for later reads
+            Sx = _section_modulus(self.moment_of_inertia[0], self.centroid[1])
+            object.__setattr__(self, "_Sx", Sx)
+            return Sx
 
     @property
-    def Sy(self) -> Optional[tuple[float, float]]:
-        if not self.Iyy or not self.centroid[0]:
-            return None
-        return self.Iyy / self.centroid[0][0], self.Iyy / self.centroid[0][1]
+    def Sy(self) -> Optional[tuple[Optional[float], Optional[float]]]:
+        try:
+            return self._Sy
+        except AttributeError:
+            Sy = _section_modulus(self.moment_of_inertia[1], self.centroid[0])
+            object.__setattr__(self, "_Sy", Sy)
+            return Sy
 
     def __str__(self) -> str:
-        return f"""CG X: {self.centroid[0][0]:0.3f}\t{self.centroid[0][1]:0.3f}
-CG Y: {self.centroid[1][0]:0.3f}\t{self.centroid[1][1]:0.3f}
-Area: {self.area:0.3f}
-Ixx: {self.Ixx:0.3f}
-Iyy: {self.Iyy:0.3f}
-Sx: {self.Sx[0]:0.3f}\t{self.Sx[1]:0.3f}
-Sy: {self.Sy[0]:0.3f}\t{self.Sy[1]:0.3f}"""
+        (cx0, cx1), (cy0, cy1) = self.centroid
+        Ixx, Iyy = self.moment_of_inertia
+        sx0, sx1 = self.Sx
+        sy0, sy1 = self.Sy
+        return f"""CG X: {cx0:.3f}\t{cx1:.3f}
+CG Y: {cy0:.3f}\t{cy1:.3f}
+Area: {self.area:.3f}
+Ixx: {Ixx:.3f}
+Iyy: {Iyy:.3f}
+Sx: {sx0:.3f}\t{sx1:.3f}
+Sy: {sy0:.3f}\t{sy1:.3f}"""
+
+
+def _section_modulus(
+    inertia: Optional[float], fibers: Optional[tuple[float, float]]
+) -> Optional[tuple[Optional[float], Optional[float]]]:
+    if not inertia or not fibers:
+        return None
+    # A fibre on the neutral axis has no section modulus, the other one still does
+    return tuple(inertia / fiber if fiber else None for fiber in fibers)
 
 
 def bar(depth: float, thickness: float) -> Section:
@@ -52,8 +78,9 @@ def bar(depth: float, thickness: float) -> Section:
     y = depth / 2
     x = thickness / 2
     area = depth * thickness
-    Ixx = depth**3 * thickness / 12
-    Iyy = thickness**3 * depth / 12
+    area_over_12 = area / 12
+    Ixx = depth * depth * area_over_12
+    Iyy = thickness * thickness * area_over_12
     return Section(
         centroid=((x, x), (y, y)),
         area=area,
@@ -66,38 +93,64 @@ def tbeam(
 ) -> Section:
     height = depth - web_thick
     area = flg_width * flg_thick + height * web_thick
-    sum_b_d_squared = depth**2 * web_thick + flg_thick**2 * (flg_width - web_thick)
+    sum_b_d_squared = (
+        depth * depth * web_thick + flg_thick * flg_thick * (flg_width - web_thick)
+    )
     y = depth - sum_b_d_squared / (2 * area)
     x = flg_width / 2
+    y_top = depth - y
+    y_under_flange = y_top - flg_thick
     b_d_cubed = (
-        web_thick * y**3
-        + flg_width * (depth - y) ** 3
-        - (flg_width - web_thick) * (depth - y - flg_thick) ** 3
+        web_thick * y * y * y
+        + flg_width * y_top * y_top * y_top
+        - (flg_width - web_thick) * y_under_flange * y_under_flange * y_under_flange
     )
-    Ixx = 1 / 3 * b_d_cubed
-    Iyy = web_thick**3 * height / 12 + flg_width**3 * flg_thick / 12
+    Ixx = b_d_cubed / 3
+    Iyy = (
+        web_thick * web_thick * web_thick * height
+        + flg_width * flg_width * flg_width * flg_thick
+    ) / 12
     return Section(
-        centroid=((x, x), (y, depth - y)),
+        centroid=((x, x), (y, y_top)),
         area=area,
         moment_of_inertia=(Ixx, Iyy),
     )
 
 
 def pipe(od: float, thickness: float) -> Section:
-    outer = circle(od / 2)
-    inner = circle(od / 2 - thickness)
+    """Calculate the properties of a pipe.
+
+    example:
+        >>> pipe(2, 0.5)
+        Section(centroid=((1.0, 1.0), (1.0, 1.0)), area=2.356194490192345, moment_of_inertia=(0.7363107781851077, 0.7363107781851077))
+    """
+    outer_radius = od / 2
+    inner_radius = outer_radius - thickness
+    outer_squared = outer_radius * outer_radius
+    inner_squared = inner_radius * inner_radius
+    area = pi * (outer_squared - inner_squared)
+    inertia = pi * (outer_squared * outer_squared - inner_squared * inner_squared) / 4
     return Section(
-        centroid=outer.centroid,
-        area=outer.area - inner.area,
-        moment_of_inertia=(outer.Ixx - inner.Ixx, outer.Iyy - inner.Iyy),
+        centroid=((outer_radius, outer_radius), (outer_radius, outer_radius)),
+        area=area,
+        moment_of_inertia=(inertia, inertia),
     )
 
 
 def circle(radius: float) -> Section:
+    """Calculate the properties of a solid circle from its radius.
+
+    example:
+        >>> circle(1)
+        Section(centroid=((1, 1), (1, 1)), area=3.141592653589793, moment_of_inertia=(0.7853981633974483, 0.7853981633974483))
+    """
+    radius_squared = radius * radius
+    area = pi * radius_squared
+    inertia = area * radius_squared / 4
     return Section(
         centroid=((radius, radius), (radius, radius)),
-        area=pi * radius**2,
-        moment_of_inertia=(pi * (radius**4) / 64, pi * (radius**4) / 64),
+        area=area,
+        moment_of_inertia=(inertia, inertia),
     )
 
 
@@ -107,9 +160,13 @@ def Ibeam_equalflange(
     h = depth - web_thick
     y = depth / 2
     x = flg_width / 2
+    depth_cubed = depth * depth * depth
+    h_cubed = h * h * h
+    flg_width_cubed = flg_width * flg_width * flg_width
+    web_thick_cubed = web_thick * web_thick * web_thick
     area = 2 * flg_width * flg_thick + h * web_thick
-    Ixx = (flg_width * depth**3 - h**3 * (flg_width - web_thick)) / 12
-    Iyy = (2 * flg_thick * flg_width**3 + h * web_thick**3) / 12
+    Ixx = (flg_width * depth_cubed - h_cubed * (flg_width - web_thick)) / 12
+    Iyy = (2 * flg_thick * flg_width_cubed + h * web_thick_cubed) / 12
     return Section(
         centroid=((x, x), (y, y)),
         area=area,
@@ -120,17 +177,33 @@ def Ibeam_equalflange(
 def parallel_axis(
     widths: Iterable[float], heights: Iterable[float], axis_offset: float = 0
 ) -> tuple[Section, float]:
+    """Calculate the section of stacked strips about their own neutral axis.
+    Also returns the moment of inertia about the datum at axis_offset.
 
+    example:
+        >>> section, Ide = parallel_axis([2], [1], axis_offset=-1)
+        >>> section, Ide
+        (Section(centroid=(None, (0.0, 1.0)), area=4, moment_of_inertia=(1.3333333333333333, None)), 1.3333333333333333)
+        >>> section.Sx
+        (None, 1.3333333333333333)
+    """
     prev = axis_offset
+    prev_squared = prev * prev
+    prev_cubed = prev_squared * prev
     area = moment = Ide = 0
     for width, height in zip(widths, heights):
+        # Each strip's top is the next strip's bottom, so its powers carry over
+        height_squared = height * height
+        height_cubed = height_squared * height
         area += width * (height - prev)
-        moment += width * (height**2 - prev**2) / 2
-        Ide += width * (height**3 - prev**3) / 3
-        prev = height
+        moment += width * (height_squared - prev_squared)
+        Ide += width * (height_cubed - prev_cubed)
+        prev, prev_squared, prev_cubed = height, height_squared, height_cubed
+    moment /= 2
+    Ide /= 3
 
     d = moment / area
-    Ixx = Ide - area * d**2
+    Ixx = Ide - area * d * d
     return (
         Section(
             centroid=(None, (d, prev - d)),
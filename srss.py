@@ -4,6 +4,10 @@ import math
 def srss(*args: float) -> float:
     """Calculate the square-root-sum-of-squares of floats
 
+    A single array argument (anything with ravel(), e.g. a numpy array) is
+    reduced over all of its elements as float64. Unlike the float arguments,
+    its squares are summed directly, so values above ~1e154 overflow to inf.
+
     example:
         >>> srss(*range(5))
         5.477225575051661
@@ -11,7 +15,10 @@ def srss(*args: float) -> float:
         11.020548988140291
     """
 
-    return math.sqrt(sum(num**2 for num in args))
+    if len(args) == 1 and hasattr(args[0], "ravel"):
+        values = args[0].ravel().astype(float)
+        return math.sqrt(float(values @ values))
+    return math.hypot(*args)
 
 
 if __name__ == "__main__":